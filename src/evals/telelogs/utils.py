@@ -1,6 +1,4 @@
-from collections import Counter
-from itertools import groupby
-from operator import attrgetter
+from collections import Counter, defaultdict
 
 from inspect_ai.scorer import CORRECT, SampleScore, Value, metric
 
@@ -15,6 +13,22 @@ def maj_at_k():
 
     Returns:
         Metric function that computes majority-vote accuracy.
+
+    Example:
+        Sample ``1`` has a correct majority answer. Sample ``"b"`` only
+        got the right answer outside its majority, so it does not count:
+
+        >>> from inspect_ai.scorer import INCORRECT, Score
+        >>> scores = [
+        ...     SampleScore(score=Score(value=CORRECT, answer="1"), sample_id=1),
+        ...     SampleScore(score=Score(value=CORRECT, answer="1"), sample_id=1),
+        ...     SampleScore(score=Score(value=INCORRECT, answer="2"), sample_id=1),
+        ...     SampleScore(score=Score(value=INCORRECT, answer="3"), sample_id="b"),
+        ...     SampleScore(score=Score(value=INCORRECT, answer="3"), sample_id="b"),
+        ...     SampleScore(score=Score(value=CORRECT, answer="4"), sample_id="b"),
+        ... ]
+        >>> maj_at_k()(scores)
+        0.5
     """
 
     def metric_fn(scores: list[SampleScore]) -> Value:
@@ -22,11 +36,9 @@ def maj_at_k():
             return 0.0
 
         # Group scores by sample_id
-        sorted_scores = sorted(scores, key=attrgetter("sample_id"))
-        grouped = {
-            sample_id: list(group)
-            for sample_id, group in groupby(sorted_scores, key=attrgetter("sample_id"))
-        }
+        grouped: dict[str | int | None, list[SampleScore]] = defaultdict(list)
+        for sample_score in scores:
+            grouped[sample_score.sample_id].append(sample_score)
 
         correct = 0
         for sample_scores in grouped.values():